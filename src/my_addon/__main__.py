@@ -1,44 +1,65 @@
 """Main entry point for the add-on."""
 
-import asyncio
 import logging
 import sys
+from types import ModuleType
+
+from aiohttp import web
 
 from my_addon.config import Config
-from my_addon.server import start_server
+from my_addon.server import create_app
+
+uvloop: ModuleType | None
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+# Add-on log_level option values mapped to stdlib logging levels
+_LOG_LEVEL_MAP = {
+    "trace": logging.DEBUG,
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "fatal": logging.CRITICAL,
+}
 
 
 def setup_logging(log_level: str = "info") -> None:
-    """Setup logging configuration."""
-    import colorlog
-
-    log_level_map = {
-        "trace": logging.DEBUG,
-        "debug": logging.DEBUG,
-        "info": logging.INFO,
-        "warning": logging.WARNING,
-        "error": logging.ERROR,
-        "fatal": logging.CRITICAL,
-    }
-
-    level = log_level_map.get(log_level.lower(), logging.INFO)
-
-    handler = colorlog.StreamHandler()
-    handler.setFormatter(
-        colorlog.ColoredFormatter(
-            "%(log_color)s%(levelname)-8s%(reset)s "
-            "%(blue)s%(name)s%(reset)s %(message)s",
-            log_colors={
-                "DEBUG": "cyan",
-                "INFO": "green",
-                "WARNING": "yellow",
-                "ERROR": "red",
-                "CRITICAL": "red,bg_white",
-            },
+    """Setup logging configuration.
+
+    Logs go to stderr. Colored output is only used when stderr is a terminal;
+    captured container logs get a plain formatter.
+    """
+    level = _LOG_LEVEL_MAP.get(log_level.lower(), logging.INFO)
+
+    stream = sys.stderr
+    handler: logging.Handler
+    if stream.isatty():
+        import colorlog
+
+        handler = colorlog.StreamHandler(stream)
+        handler.setFormatter(
+            colorlog.ColoredFormatter(
+                "%(log_color)s%(levelname)-8s%(reset)s "
+                "%(blue)s%(name)s%(reset)s %(message)s",
+                log_colors={
+                    "DEBUG": "cyan",
+                    "INFO": "green",
+                    "WARNING": "yellow",
+                    "ERROR": "red",
+                    "CRITICAL": "red,bg_white",
+                },
+            )
         )
-    )
+    else:
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(levelname)-8s %(name)s %(message)s"))
 
-    logging.basicConfig(level=level, handlers=[handler])
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(level)
 
 
 def main() -> int:
@@ -52,8 +73,17 @@ def main() -> int:
         logger.info("Starting My Python Add-on v%s", "0.1.0")
         logger.info("Log level: %s", config.log_level)
 
-        # Run the server
-        asyncio.run(start_server(config))
+        # Run the server until SIGINT/SIGTERM, on uvloop where available
+        logger.info("Starting web server on port 8000...")
+        web.run_app(
+            create_app(config),
+            host="0.0.0.0",
+            port=8000,
+            loop=uvloop.new_event_loop() if uvloop is not None else None,
+            # run_app reports the bound address once the site has started
+            print=logger.info,
+        )
+        logger.info("Server stopped")
         return 0
 
     except KeyboardInterrupt:
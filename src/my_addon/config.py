@@ -1,13 +1,17 @@
 """Configuration handling for the add-on."""
 
-import json
 import logging
 import os
 from dataclasses import dataclass
 from pathlib import Path
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Home Assistant add-on location first, then the local development fallback
+DEFAULT_OPTIONS_PATHS = (Path("/data/options.json"), Path("data/options.json"))
+
 
 @dataclass
 class Config:
@@ -27,25 +31,26 @@ class Config:
 
         Raises:
             FileNotFoundError: If options.json doesn't exist
-            json.JSONDecodeError: If options.json is invalid
+            orjson.JSONDecodeError: If options.json is invalid
         """
         if path is None:
-            # Default path in Home Assistant add-on environment
-            path = Path("/data/options.json")
-
-            # Fallback for local development
-            if not path.exists():
-                path = Path("data/options.json")
-
-            # If still doesn't exist, use defaults
-            if not path.exists():
+            # Read each candidate directly instead of stat-ing it first
+            for path in DEFAULT_OPTIONS_PATHS:
+                try:
+                    raw = path.read_bytes()
+                    break
+                except FileNotFoundError:
+                    continue
+            else:
+                # If none exists, use defaults
                 logger.warning("Options file not found at %s, using defaults", path)
                 return cls()
+        else:
+            raw = path.read_bytes()
 
         logger.info("Loading configuration from %s", path)
 
-        with open(path) as f:
-            options = json.load(f)
+        options = orjson.loads(raw)
 
         return cls(
             log_level=options.get("log_level", "info"),
@@ -1,7 +1,9 @@
 """Example web server for the add-on."""
 
 import logging
+from functools import lru_cache
 
+import orjson
 from aiohttp import web
 
 from my_addon.config import Config
@@ -9,64 +11,85 @@ from my_addon.supervisor import SupervisorAPI
 
 logger = logging.getLogger(__name__)
 
+# Static response bodies, encoded once at import time
+_INDEX_BODY = b"<h1>My Python Add-on</h1><p>The add-on is running!</p>"
+_PING_BODY = b'{"status":"ok"}'
+
+
+@lru_cache(maxsize=8)
+def _healthy_body(addon_name: str) -> bytes:
+    """Serialize the healthy /health payload once per add-on name."""
+    return orjson.dumps({"status": "healthy", "addon": addon_name})
+
 
 async def handle_index(request: web.Request) -> web.Response:
     """Handle index page request."""
-    return web.Response(
-        text="<h1>My Python Add-on</h1><p>The add-on is running!</p>",
-        content_type="text/html",
-    )
+    return web.Response(body=_INDEX_BODY, content_type="text/html", charset="utf-8")
+
+
+async def handle_ping(request: web.Request) -> web.Response:
+    """Handle shallow liveness check request.
+
+    Answers without touching the Supervisor; use for frequent probes.
+    """
+    return web.Response(body=_PING_BODY, content_type="application/json")
 
 
 async def handle_health(request: web.Request) -> web.Response:
-    """Handle health check request."""
+    """Handle deep health check request.
+
+    Verifies the Supervisor is reachable, so prefer /ping for frequent probes.
+    """
     supervisor: SupervisorAPI = request.app["supervisor"]
 
     try:
         info = await supervisor.get_addon_info()
-        return web.json_response(
-            {
-                "status": "healthy",
-                "addon": info.get("data", {}).get("name", "unknown"),
-            }
+        return web.Response(
+            body=_healthy_body(info.get("data", {}).get("name", "unknown")),
+            content_type="application/json",
         )
     except Exception as e:
         logger.error("Health check failed: %s", e)
         return web.json_response({"status": "unhealthy", "error": str(e)}, status=500)
 
 
-async def start_server(config: Config) -> None:
-    """Start the web server.
+async def _open_supervisor(app: web.Application) -> None:
+    """Open the Supervisor API session on application startup."""
+    await app["supervisor"].__aenter__()
+
+
+async def _close_supervisor(app: web.Application) -> None:
+    """Close the Supervisor API session on application cleanup."""
+    await app["supervisor"].__aexit__(None, None, None)
+
+
+def create_app(config: Config) -> web.Application:
+    """Create the web application.
+
+    The Supervisor API client is opened and closed by the application's
+    startup and cleanup hooks, so it lives exactly as long as the server.
 
     Args:
         config: Add-on configuration
+
+    Returns:
+        Configured aiohttp application, ready for ``web.run_app``
     """
     app = web.Application()
 
     # Initialize Supervisor API client
-    supervisor = SupervisorAPI()
-    app["supervisor"] = supervisor
+    app["supervisor"] = SupervisorAPI()
     app["config"] = config
+    app.on_startup.append(_open_supervisor)
+    app.on_cleanup.append(_close_supervisor)
+
+    # Setup routes (plain paths only, so resolution stays a direct lookup)
+    app.add_routes(
+        [
+            web.get("/", handle_index),
+            web.get("/health", handle_health),
+            web.get("/ping", handle_ping),
+        ]
+    )
 
-    # Setup routes
-    app.router.add_get("/", handle_index)
-    app.router.add_get("/health", handle_health)
-
-    # Run the server
-    logger.info("Starting web server on port 8000...")
-    runner = web.AppRunner(app)
-    await runner.setup()
-    site = web.TCPSite(runner, "0.0.0.0", 8000)
-    await site.start()
-
-    logger.info("Server started successfully")
-
-    # Keep the server running
-    try:
-        # This will run forever until interrupted
-        import asyncio
-
-        await asyncio.Event().wait()
-    finally:
-        await supervisor.__aexit__(None, None, None)
-        await runner.cleanup()
+    return app
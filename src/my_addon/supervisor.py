@@ -1,13 +1,45 @@
 """Home Assistant Supervisor API client."""
 
+import asyncio
+import contextlib
 import logging
 import os
+from collections.abc import Mapping
+from functools import partial
+from types import MappingProxyType
 from typing import Any
 
 import aiohttp
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# The add-on environment is fixed for the life of the process, so read it once
+_SUPERVISOR_TOKEN = os.getenv("SUPERVISOR_TOKEN")
+_SUPERVISOR_SOCKET = os.getenv("SUPERVISOR_SOCKET")
+
+_HEADERS: Mapping[str, str] = MappingProxyType(
+    {
+        "Content-Type": "application/json",
+        **(
+            {"Authorization": f"Bearer {_SUPERVISOR_TOKEN}"}
+            if _SUPERVISOR_TOKEN
+            else {}
+        ),
+    }
+)
+
+# How long add-on info is served from cache before asking the Supervisor again
+ADDON_INFO_TTL = 5.0
+
+# Upper bound on Supervisor requests in flight at once per client
+MAX_CONCURRENT_REQUESTS = 8
+
+# Transient failures of idempotent requests are retried with exponential backoff
+MAX_ATTEMPTS = 3
+RETRY_METHODS = frozenset({"GET", "HEAD"})
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
 
 class SupervisorAPI:
     """Client for communicating with Home Assistant Supervisor."""
@@ -18,34 +50,94 @@ class SupervisorAPI:
         Args:
             session: Optional aiohttp session (will create one if not provided)
         """
-        self.token = os.getenv("SUPERVISOR_TOKEN")
         self.base_url = "http://supervisor"
+        # Optional UNIX socket to reach the Supervisor without TCP/DNS
+        self.socket_path = _SUPERVISOR_SOCKET
         self._session = session
         self._own_session = session is None
+        # Owned sessions carry the headers themselves; injected ones need
+        # them passed per request.
+        self._request_headers = None if self._own_session else _HEADERS
+        self._addon_info_cache: tuple[float, dict[str, Any]] | None = None
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # GETs waiting for the batcher, keyed by endpoint
+        self._pending: dict[str, list[asyncio.Future[dict[str, Any]]]] = {}
+        self._pending_event = asyncio.Event()
+        self._batcher_task: asyncio.Task[None] | None = None
+        # Running Supervisor GETs, keyed by endpoint; later waiters attach here
+        self._inflight: dict[str, asyncio.Task[dict[str, Any]]] = {}
 
     async def __aenter__(self) -> "SupervisorAPI":
         """Async context manager entry."""
         if self._session is None:
-            self._session = aiohttp.ClientSession()
+            self._session = aiohttp.ClientSession(
+                connector=self._create_connector(),
+                timeout=aiohttp.ClientTimeout(total=10),
+                headers=_HEADERS,
+                # Content-Type is already a session header; nothing needs a UA
+                skip_auto_headers=("User-Agent", "Content-Type"),
+            )
         return self
 
+    def _create_connector(self) -> aiohttp.BaseConnector:
+        """Create the connector for an owned session.
+
+        Uses ``SUPERVISOR_SOCKET`` when set; ``base_url`` then only supplies
+        the Host header.
+
+        Returns:
+            UNIX socket connector, or a pooled TCP connector
+        """
+        if self.socket_path:
+            logger.debug("Using Supervisor socket %s", self.socket_path)
+            return aiohttp.UnixConnector(
+                path=self.socket_path, limit=20, keepalive_timeout=60
+            )
+
+        # Reuse keep-alive connections to the Supervisor across requests.
+        # The host never changes, so resolve it asynchronously and keep the
+        # answer for an hour.
+        return aiohttp.TCPConnector(
+            resolver=aiohttp.AsyncResolver(),
+            use_dns_cache=True,
+            ttl_dns_cache=3600,
+            limit=20,
+            limit_per_host=10,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True,
+        )
+
     async def __aexit__(self, *args: Any) -> None:
         """Async context manager exit."""
+        if self._batcher_task is not None:
+            self._batcher_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._batcher_task
+            self._batcher_task = None
+
+        # Release callers that are still queued or attached to a running fetch
+        for waiters in self._pending.values():
+            for waiter in waiters:
+                waiter.cancel()
+        self._pending.clear()
+        inflight = list(self._inflight.values())
+        for task in inflight:
+            task.cancel()
+        await asyncio.gather(*inflight, return_exceptions=True)
+
         if self._own_session and self._session:
             await self._session.close()
 
-    def _get_headers(self) -> dict[str, str]:
-        """Get headers for Supervisor API requests."""
-        headers = {"Content-Type": "application/json"}
-        if self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
-        return headers
-
     async def _request(
         self, method: str, endpoint: str, **kwargs: Any
     ) -> dict[str, Any]:
         """Make a request to the Supervisor API.
 
+        For methods in ``RETRY_METHODS``, connection errors and responses in
+        ``RETRY_STATUSES`` are retried up to ``MAX_ATTEMPTS`` times with
+        exponential backoff. Other methods are never retried, since the
+        Supervisor may already have acted on the request.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint (without base URL)
@@ -61,15 +153,106 @@ class SupervisorAPI:
             raise RuntimeError("Session not initialized")
 
         url = f"{self.base_url}/{endpoint}"
-        headers = self._get_headers()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            logger.debug("Supervisor API request: %s %s", method, endpoint)
+
+            try:
+                async with self._semaphore:
+                    async with self._session.request(
+                        method, url, headers=self._request_headers, **kwargs
+                    ) as response:
+                        response.raise_for_status()
+                        return orjson.loads(await response.read())
+            except (aiohttp.ClientResponseError, aiohttp.ClientConnectionError) as e:
+                retryable = method.upper() in RETRY_METHODS and (
+                    not isinstance(e, aiohttp.ClientResponseError)
+                    or e.status in RETRY_STATUSES
+                )
+                if not retryable or attempt >= MAX_ATTEMPTS:
+                    raise
+
+                delay = min(0.1 * 2 ** (attempt - 1), 2.0)
+                logger.warning(
+                    "Supervisor API %s %s failed (%s), retrying in %.1fs",
+                    method,
+                    endpoint,
+                    e,
+                    delay,
+                )
+
+            # Back off outside the semaphore so other requests can proceed
+            await asyncio.sleep(delay)
 
-        logger.debug("Supervisor API request: %s %s", method, endpoint)
+    async def _batched_get(self, endpoint: str) -> dict[str, Any]:
+        """Queue a GET request and wait for the batcher to serve it.
 
-        async with self._session.request(
-            method, url, headers=headers, **kwargs
-        ) as response:
-            response.raise_for_status()
-            return await response.json()
+        Concurrent calls for the same endpoint are answered by a single
+        Supervisor request.
+
+        Args:
+            endpoint: API endpoint (without base URL)
+
+        Returns:
+            JSON response as dict
+        """
+        loop = asyncio.get_running_loop()
+        if self._batcher_task is None or self._batcher_task.done():
+            self._batcher_task = loop.create_task(self._run_batcher())
+
+        future: asyncio.Future[dict[str, Any]] = loop.create_future()
+        self._pending.setdefault(endpoint, []).append(future)
+        self._pending_event.set()
+        return await future
+
+    async def _run_batcher(self) -> None:
+        """Drain queued GETs, issuing at most one request per endpoint.
+
+        Waiters for an endpoint that is already being fetched attach to that
+        request instead of starting another one. The batcher never waits for
+        a fetch to finish, so a slow endpoint does not hold up the others.
+        """
+        while True:
+            await self._pending_event.wait()
+            # Let callers scheduled in the same loop iteration join the batch
+            await asyncio.sleep(0)
+            self._pending_event.clear()
+
+            batch, self._pending = self._pending, {}
+            for endpoint, waiters in batch.items():
+                task = self._inflight.get(endpoint)
+                if task is None:
+                    task = asyncio.create_task(self._request("GET", endpoint))
+                    self._inflight[endpoint] = task
+                    task.add_done_callback(partial(self._finish_fetch, endpoint))
+                task.add_done_callback(partial(self._resolve_waiters, waiters))
+
+    def _finish_fetch(self, endpoint: str, task: asyncio.Task[dict[str, Any]]) -> None:
+        """Forget a finished fetch so the next batch starts a fresh one."""
+        if self._inflight.get(endpoint) is task:
+            del self._inflight[endpoint]
+
+    @staticmethod
+    def _resolve_waiters(
+        waiters: list[asyncio.Future[dict[str, Any]]],
+        task: asyncio.Task[dict[str, Any]],
+    ) -> None:
+        """Hand the outcome of a fetch to every waiter still interested."""
+        if task.cancelled():
+            for waiter in waiters:
+                waiter.cancel()
+            return
+
+        error = task.exception()
+        for waiter in waiters:
+            if waiter.done():
+                continue
+            if error is not None:
+                waiter.set_exception(error)
+            else:
+                waiter.set_result(task.result())
 
     async def get_info(self) -> dict[str, Any]:
         """Get Supervisor information.
@@ -77,15 +260,27 @@ class SupervisorAPI:
         Returns:
             Supervisor info as dict
         """
-        return await self._request("GET", "info")
+        return await self._batched_get("info")
 
     async def get_addon_info(self) -> dict[str, Any]:
         """Get information about this add-on.
 
+        Results are cached for ``ADDON_INFO_TTL`` seconds and concurrent
+        callers are served by a single batched request.
+
         Returns:
             Add-on info as dict
         """
-        return await self._request("GET", "addons/self/info")
+        loop = asyncio.get_running_loop()
+
+        if self._addon_info_cache is not None:
+            fetched_at, data = self._addon_info_cache
+            if loop.time() - fetched_at < ADDON_INFO_TTL:
+                return data
+
+        data = await self._batched_get("addons/self/info")
+        self._addon_info_cache = (loop.time(), data)
+        return data
 
     async def get_homeassistant_api_info(self) -> dict[str, Any]:
         """Get Home Assistant API information.
@@ -93,7 +288,7 @@ class SupervisorAPI:
         Returns:
             Home Assistant API info including URL and token
         """
-        return await self._request("GET", "homeassistant/api")
+        return await self._batched_get("homeassistant/api")
 
     async def ping_homeassistant(self) -> bool:
         """Check if Home Assistant is accessible.
@@ -102,7 +297,7 @@ class SupervisorAPI:
             True if Home Assistant is accessible, False otherwise
         """
         try:
-            await self._request("GET", "homeassistant/api")
+            await self.get_homeassistant_api_info()
             return True
         except Exception as e:
             logger.warning("Failed to ping Home Assistant: %s", e)
@@ -4,10 +4,74 @@ See @tests/AGENTS.md for test guidance.
 See @docs/tooling/pytest.md for pytest documentation.
 """
 
+import asyncio
+from typing import Any
+
 import pytest
+from aiohttp import web
 
 
 @pytest.fixture
 def sample_data() -> dict[str, str]:
     """Provide sample data for tests."""
     return {"key": "value"}
+
+
+class FakeSupervisor:
+    """Scriptable stand-in for the Supervisor API.
+
+    Every request is recorded and answered with ``{"data": {"path": ...}}``.
+    ``statuses`` maps a path to the status codes to answer with, in order;
+    once exhausted the path answers 200. A path listed in ``gates`` is held
+    until its event is set.
+    """
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, str, dict[str, str]]] = []
+        self.statuses: dict[str, list[int]] = {}
+        self.gates: dict[str, asyncio.Event] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._arrived = asyncio.Condition()
+
+    def app(self) -> web.Application:
+        """Build an aiohttp application serving every path."""
+        app = web.Application()
+        app.router.add_route("*", "/{endpoint:.*}", self._handle)
+        return app
+
+    async def wait_for_requests(self, count: int) -> None:
+        """Wait until at least ``count`` requests have arrived."""
+        async with self._arrived:
+            await self._arrived.wait_for(lambda: len(self.requests) >= count)
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.requests.append((request.method, request.path, dict(request.headers)))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        async with self._arrived:
+            self._arrived.notify_all()
+
+        try:
+            gate = self.gates.get(request.path)
+            if gate is not None:
+                await gate.wait()
+        finally:
+            self.in_flight -= 1
+
+        statuses = self.statuses.get(request.path, [])
+        status = statuses.pop(0) if statuses else 200
+        return web.json_response({"data": {"path": request.path}}, status=status)
+
+
+@pytest.fixture
+def fake_supervisor() -> FakeSupervisor:
+    """Provide a fake Supervisor to serve."""
+    return FakeSupervisor()
+
+
+@pytest.fixture
+async def supervisor_url(aiohttp_server: Any, fake_supervisor: FakeSupervisor) -> str:
+    """Serve the fake Supervisor over TCP and return its base URL."""
+    server = await aiohttp_server(fake_supervisor.app())
+    return str(server.make_url("")).rstrip("/")
@@ -0,0 +1,64 @@
+"""Tests for configuration loading.
+
+See @tests/AGENTS.md for test guidance.
+"""
+
+import logging
+from pathlib import Path
+
+import orjson
+import pytest
+
+from my_addon import config
+from my_addon.config import Config
+
+
+@pytest.fixture
+def options_paths(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Point the default options locations at two files under tmp_path."""
+    paths = [tmp_path / "ha" / "options.json", tmp_path / "local" / "options.json"]
+    for path in paths:
+        path.parent.mkdir()
+    monkeypatch.setattr(config, "DEFAULT_OPTIONS_PATHS", tuple(paths))
+    return paths
+
+
+def test_from_options_reads_first_default(options_paths: list[Path]):
+    """Test that the Home Assistant location wins when present."""
+    options_paths[0].write_bytes(b'{"log_level": "debug"}')
+    options_paths[1].write_bytes(b'{"log_level": "error"}')
+
+    assert Config.from_options().log_level == "debug"
+
+
+def test_from_options_falls_back_to_second_default(options_paths: list[Path]):
+    """Test that the local development location is used as a fallback."""
+    options_paths[1].write_bytes(b'{"log_level": "warning"}')
+
+    assert Config.from_options().log_level == "warning"
+
+
+def test_from_options_uses_defaults_without_file(
+    options_paths: list[Path], caplog: pytest.LogCaptureFixture
+):
+    """Test that defaults are used, with a warning, when no file exists."""
+    with caplog.at_level(logging.WARNING, logger="my_addon.config"):
+        result = Config.from_options()
+
+    assert result == Config()
+    assert "Options file not found" in caplog.text
+
+
+def test_from_options_explicit_missing_path_raises(tmp_path: Path):
+    """Test that an explicit path must exist."""
+    with pytest.raises(FileNotFoundError):
+        Config.from_options(tmp_path / "missing.json")
+
+
+def test_from_options_invalid_json_raises(tmp_path: Path):
+    """Test that malformed options.json raises orjson.JSONDecodeError."""
+    path = tmp_path / "options.json"
+    path.write_bytes(b"{not json")
+
+    with pytest.raises(orjson.JSONDecodeError):
+        Config.from_options(path)
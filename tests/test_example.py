@@ -3,8 +3,7 @@
 See @tests/AGENTS.md for test guidance.
 """
 
-# TODO: Update import to your package name
-from my_package import __version__
+from my_addon import __version__
 
 
 def test_version():
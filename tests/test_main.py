@@ -0,0 +1,47 @@
+"""Tests for the add-on entry point.
+
+See @tests/AGENTS.md for test guidance.
+"""
+
+import logging
+import sys
+from collections.abc import Iterator
+
+import colorlog
+import pytest
+
+from my_addon.__main__ import setup_logging
+
+
+@pytest.fixture
+def root_logger() -> Iterator[logging.Logger]:
+    """Provide the root logger, restoring its handlers and level afterwards."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield root
+    root.handlers = handlers
+    root.setLevel(level)
+
+
+@pytest.mark.parametrize(
+    ("isatty", "formatter_type"),
+    [(True, colorlog.ColoredFormatter), (False, logging.Formatter)],
+)
+def test_setup_logging_formatter_follows_stderr(
+    root_logger: logging.Logger,
+    monkeypatch: pytest.MonkeyPatch,
+    isatty: bool,
+    formatter_type: type[logging.Formatter],
+):
+    """Test that colors are used only when stderr is a terminal."""
+    monkeypatch.setattr(sys.stderr, "isatty", lambda: isatty)
+
+    setup_logging("debug")
+    setup_logging("debug")
+
+    assert len(root_logger.handlers) == 1
+    handler = root_logger.handlers[0]
+    assert isinstance(handler, logging.StreamHandler)
+    assert handler.stream is sys.stderr
+    assert type(handler.formatter) is formatter_type
+    assert root_logger.level == logging.DEBUG
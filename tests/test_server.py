@@ -0,0 +1,128 @@
+"""Tests for the web server.
+
+See @tests/AGENTS.md for test guidance.
+"""
+
+from typing import Any
+
+import orjson
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient
+
+from my_addon import server
+from my_addon.config import Config
+from my_addon.server import create_app
+from tests.conftest import FakeSupervisor
+
+
+class StubSupervisor:
+    """Stand-in for SupervisorAPI that never touches the network."""
+
+    def __init__(self) -> None:
+        self.info: dict[str, Any] = {"data": {"name": "Test Add-on"}}
+        self.error: Exception | None = None
+        self.calls = 0
+
+    async def __aenter__(self) -> "StubSupervisor":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    async def get_addon_info(self) -> dict[str, Any]:
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.info
+
+
+@pytest.fixture
+def stub_supervisor(monkeypatch: pytest.MonkeyPatch) -> StubSupervisor:
+    """Make create_app use a StubSupervisor."""
+    stub = StubSupervisor()
+    monkeypatch.setattr(server, "SupervisorAPI", lambda: stub)
+    return stub
+
+
+@pytest.fixture
+async def client(aiohttp_client: Any, stub_supervisor: StubSupervisor) -> TestClient:
+    """Provide a test client for the app, backed by the stub Supervisor."""
+    return await aiohttp_client(create_app(Config()))
+
+
+async def test_supervisor_session_follows_app_lifecycle(
+    supervisor_url: str, fake_supervisor: FakeSupervisor
+):
+    """Test that the Supervisor session is usable between startup and cleanup."""
+    app = create_app(Config())
+    runner = web.AppRunner(app)
+    await runner.setup()
+
+    supervisor = app["supervisor"]
+    assert supervisor._session is not None
+    assert not supervisor._session.closed
+
+    supervisor.base_url = supervisor_url
+    assert await supervisor.get_info() == {"data": {"path": "/info"}}
+
+    await runner.cleanup()
+    assert supervisor._session.closed
+
+
+async def test_health_returns_preserialized_body(
+    client: TestClient, stub_supervisor: StubSupervisor
+):
+    """Test that a healthy /health returns the cached orjson body."""
+    response = await client.get("/health")
+
+    assert response.status == 200
+    assert response.content_type == "application/json"
+    assert await response.read() == orjson.dumps(
+        {"status": "healthy", "addon": "Test Add-on"}
+    )
+
+
+async def test_health_falls_back_to_unknown_name(
+    client: TestClient, stub_supervisor: StubSupervisor
+):
+    """Test that /health reports "unknown" when the add-on has no name."""
+    stub_supervisor.info = {}
+
+    response = await client.get("/health")
+
+    assert await response.read() == orjson.dumps(
+        {"status": "healthy", "addon": "unknown"}
+    )
+
+
+async def test_health_reports_supervisor_failure(
+    client: TestClient, stub_supervisor: StubSupervisor
+):
+    """Test that a Supervisor error yields a 500 unhealthy response."""
+    stub_supervisor.error = RuntimeError("boom")
+
+    response = await client.get("/health")
+
+    assert response.status == 500
+    assert await response.json() == {"status": "unhealthy", "error": "boom"}
+
+
+async def test_ping_answers_without_supervisor(
+    client: TestClient, stub_supervisor: StubSupervisor
+):
+    """Test that /ping returns a static body and never calls the Supervisor."""
+    response = await client.get("/ping")
+
+    assert response.status == 200
+    assert response.content_type == "application/json"
+    assert await response.read() == b'{"status":"ok"}'
+    assert stub_supervisor.calls == 0
+
+
+def test_ping_route_is_registered(stub_supervisor: StubSupervisor):
+    """Test that create_app registers the /ping route."""
+    app = create_app(Config())
+
+    paths = {route.resource.canonical for route in app.router.routes()}
+    assert "/ping" in paths
@@ -0,0 +1,253 @@
+"""Tests for the Supervisor API client.
+
+See @tests/AGENTS.md for test guidance.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+from types import MappingProxyType
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from my_addon import supervisor
+from my_addon.supervisor import SupervisorAPI
+from tests.conftest import FakeSupervisor
+
+AUTH_HEADERS = MappingProxyType(
+    {"Content-Type": "application/json", "Authorization": "Bearer test-token"}
+)
+
+
+@pytest.fixture
+async def api(supervisor_url: str) -> AsyncIterator[SupervisorAPI]:
+    """Provide an entered SupervisorAPI pointed at the fake Supervisor."""
+    async with SupervisorAPI() as client:
+        client.base_url = supervisor_url
+        yield client
+
+
+async def _settle() -> None:
+    """Give queued callers a few loop iterations to reach the batcher."""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+async def test_concurrent_gets_are_coalesced(
+    api: SupervisorAPI, fake_supervisor: FakeSupervisor
+):
+    """Test that concurrent calls for one endpoint share a single request."""
+    gate = fake_supervisor.gates["/info"] = asyncio.Event()
+    calls = [asyncio.ensure_future(api.get_info()) for _ in range(10)]
+    await fake_supervisor.wait_for_requests(1)
+    gate.set()
+
+    results = await asyncio.gather(*calls)
+
+    assert all(result == {"data": {"path": "/info"}} for result in results)
+    assert len(fake_supervisor.requests) == 1
+
+
+async def test_late_callers_join_inflight_request(
+    api: SupervisorAPI, fake_supervisor: FakeSupervisor
+):
+    """Test that callers arriving mid-request attach to the running fetch."""
+    gate = fake_supervisor.gates["/addons/self/info"] = asyncio.Event()
+    first = asyncio.ensure_future(api.get_addon_info())
+    await fake_supervisor.wait_for_requests(1)
+
+    late = [asyncio.ensure_future(api.get_addon_info()) for _ in range(4)]
+    await _settle()
+    gate.set()
+    await asyncio.gather(first, *late)
+
+    assert len(fake_supervisor.requests) == 1
+
+
+async def test_errors_reach_every_waiter(
+    api: SupervisorAPI, fake_supervisor: FakeSupervisor
+):
+    """Test that a failed shared request is raised to all of its waiters."""
+    fake_supervisor.statuses["/info"] = [404]
+
+    results = await asyncio.gather(
+        *(api.get_info() for _ in range(5)), return_exceptions=True
+    )
+
+    assert all(isinstance(r, aiohttp.ClientResponseError) for r in results)
+    assert all(r.status == 404 for r in results)
+    assert len(fake_supervisor.requests) == 1
+
+
+async def test_slow_endpoint_does_not_block_others(
+    api: SupervisorAPI, fake_supervisor: FakeSupervisor
+):
+    """Test that a pending fetch for one endpoint doesn't delay another."""
+    gate = fake_supervisor.gates["/info"] = asyncio.Event()
+    slow = asyncio.ensure_future(api.get_info())
+    await fake_supervisor.wait_for_requests(1)
+
+    # The timeout only guards against a hang; the gated request never finishes
+    await asyncio.wait_for(api.get_addon_info(), timeout=5)
+
+    assert not slow.done()
+    gate.set()
+    await slow
+
+
+async def test_exit_cancels_queued_waiters(supervisor_url: str):
+    """Test that leaving the context releases callers still waiting."""
+    client = SupervisorAPI()
+    await client.__aenter__()
+    client.base_url = supervisor_url
+
+    waiter = asyncio.ensure_future(client.get_info())
+    await asyncio.sleep(0)
+    await client.__aexit__(None, None, None)
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(waiter, timeout=5)
+
+
+async def test_addon_info_cached_until_ttl_expires(
+    api: SupervisorAPI,
+    fake_supervisor: FakeSupervisor,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that add-on info is refetched only after the TTL elapses."""
+    loop = asyncio.get_running_loop()
+    real_time = loop.time
+    offset = 0.0
+    monkeypatch.setattr(loop, "time", lambda: real_time() + offset)
+
+    await api.get_addon_info()
+    await api.get_addon_info()
+    assert len(fake_supervisor.requests) == 1
+
+    offset = supervisor.ADDON_INFO_TTL
+    await api.get_addon_info()
+    assert len(fake_supervisor.requests) == 2
+
+
+async def test_owned_session_sends_headers(
+    supervisor_url: str,
+    fake_supervisor: FakeSupervisor,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that an owned session sends the auth headers."""
+    monkeypatch.setattr(supervisor, "_HEADERS", AUTH_HEADERS)
+
+    async with SupervisorAPI() as client:
+        client.base_url = supervisor_url
+        await client.get_info()
+
+    _, _, headers = fake_supervisor.requests[0]
+    assert headers["Authorization"] == "Bearer test-token"
+    assert headers["Content-Type"] == "application/json"
+
+
+async def test_injected_session_sends_headers(
+    supervisor_url: str,
+    fake_supervisor: FakeSupervisor,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that an injected session gets the auth headers per request."""
+    monkeypatch.setattr(supervisor, "_HEADERS", AUTH_HEADERS)
+
+    async with aiohttp.ClientSession() as session:
+        async with SupervisorAPI(session) as client:
+            client.base_url = supervisor_url
+            await client.get_info()
+        assert not session.closed
+
+    _, _, headers = fake_supervisor.requests[0]
+    assert headers["Authorization"] == "Bearer test-token"
+    assert headers["Content-Type"] == "application/json"
+
+
+async def test_owned_session_skips_user_agent(
+    api: SupervisorAPI, fake_supervisor: FakeSupervisor
+):
+    """Test that no auto-generated User-Agent is sent to the Supervisor."""
+    await api.get_info()
+
+    _, _, headers = fake_supervisor.requests[0]
+    assert "User-Agent" not in headers
+
+
+async def test_retries_transient_status(
+    api: SupervisorAPI, fake_supervisor: FakeSupervisor
+):
+    """Test that a GET answered with 503 is retried until it succeeds."""
+    fake_supervisor.statuses["/info"] = [503, 503]
+
+    result = await api.get_info()
+
+    assert result == {"data": {"path": "/info"}}
+    assert len(fake_supervisor.requests) == 3
+
+
+async def test_does_not_retry_client_error(
+    api: SupervisorAPI, fake_supervisor: FakeSupervisor
+):
+    """Test that a 404 is raised without retrying."""
+    fake_supervisor.statuses["/info"] = [404]
+
+    with pytest.raises(aiohttp.ClientResponseError) as exc_info:
+        await api.get_info()
+
+    assert exc_info.value.status == 404
+    assert len(fake_supervisor.requests) == 1
+
+
+async def test_does_not_retry_non_idempotent_method(
+    api: SupervisorAPI, fake_supervisor: FakeSupervisor
+):
+    """Test that a POST answered with 503 is not sent again."""
+    fake_supervisor.statuses["/addons/self/restart"] = [503]
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        await api._request("POST", "addons/self/restart")
+
+    assert len(fake_supervisor.requests) == 1
+
+
+async def test_concurrent_requests_are_capped(
+    api: SupervisorAPI, fake_supervisor: FakeSupervisor
+):
+    """Test that no more than the semaphore's limit of requests run at once."""
+    api._semaphore = asyncio.Semaphore(2)
+    gate = fake_supervisor.gates["/slow"] = asyncio.Event()
+
+    calls = [asyncio.ensure_future(api._request("GET", "slow")) for _ in range(5)]
+    await fake_supervisor.wait_for_requests(2)
+    await _settle()
+    assert fake_supervisor.in_flight == 2
+
+    gate.set()
+    await asyncio.gather(*calls)
+
+    assert len(fake_supervisor.requests) == 5
+    assert fake_supervisor.max_in_flight == 2
+
+
+async def test_unix_socket_transport(tmp_path: Path, fake_supervisor: FakeSupervisor):
+    """Test that requests go over SUPERVISOR_SOCKET with the supervisor host."""
+    socket_path = str(tmp_path / "sup.sock")
+    runner = web.AppRunner(fake_supervisor.app())
+    await runner.setup()
+    await web.UnixSite(runner, socket_path).start()
+
+    try:
+        client = SupervisorAPI()
+        client.socket_path = socket_path
+        async with client:
+            assert await client.get_info() == {"data": {"path": "/info"}}
+    finally:
+        await runner.cleanup()
+
+    _, path, headers = fake_supervisor.requests[0]
+    assert path == "/info"
+    assert headers["Host"] == "supervisor"